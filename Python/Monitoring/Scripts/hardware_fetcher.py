@@ -18,11 +18,11 @@
 #  • GPU enumeration: VGA and 3D graphics controllers                #
 #  • PCI device listing: Complete hardware inventory                 #
 #  • Multiple export formats: JSON, CSV, TXT                         #
-#  • Verbosity levels: Basic (--v), Extended (--vv), Deep (--vvv)    #
+#  • Verbosity levels: Basic (-v), Extended (-vv), Deep (-vvv)       #
 #  • Dry-run mode: Compatibility testing without file operations     #
 #                                                                    #
 # USAGE:                                                             #
-#  Standalone: python3 hardware_fetcher.py --vvv --dry-run=false     #
+#  Standalone: python3 hardware_fetcher.py -vvv --dry-run=false      #
 #  As Module: from hardware_fetcher import HardwareFetcher           #
 #                                                                    #
 # HYBRID APPROACH:                                                   #
@@ -38,69 +38,208 @@
 
 import sys
 import argparse
-import json
-import csv
+import io
 import subprocess
-from collections import OrderedDict
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import re
 import os
 from datetime import datetime
 
+try:
+    import orjson                # Optional: C/Rust JSON serializer for faster exports
+except ImportError:
+    orjson = None
+
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'hardware_fetcher')
+SKIPPED_BLOCK_PREFIXES = ('loop', 'ram')     # Loop and RAM disks are not storage hardware
+PCI_SUMMARY_CLASSES = ('01', '02', '03')    # Mass storage, network and display controllers
+SEP80 = '=' * 80                 # Banner and report section separator
+HEADER_BORDER = '#' * 80         # Section header border
+COL1_WIDTH = 28                  # Table key column width, including padding
+COL2_WIDTH = 48                  # Table value column width, including padding
+TABLE_BORDER = '+' + '=' * COL1_WIDTH + '+' + '=' * COL2_WIDTH + '+'
+TABLE_SEPARATOR = '+' + '-' * COL1_WIDTH + '+' + '-' * COL2_WIDTH + '+'
+TABLE_ROW_FORMAT = '| {:<%d} | {:<%d} |' % (COL1_WIDTH - 2, COL2_WIDTH - 2)
+IMPORTANT_CPU_FLAGS = frozenset({'vmx', 'svm', 'avx', 'avx2', 'sse4_2', 'aes', 'rdrand', 'tsx'})
+
+
+_command_locks = {}
+_command_locks_guard = threading.Lock()
+
+
+def _command_lock(command):
+    """Return the lock that lets only one thread run a given command at a time"""
+    with _command_locks_guard:
+        return _command_locks.setdefault(command, threading.Lock())
+
+
+@lru_cache(maxsize=256)
+def _cached_command(command):
+    """Execute a command once per process (tuples run without a shell, strings through /bin/sh)"""
+    try:
+        if isinstance(command, tuple):
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                                    universal_newlines=True, check=False).stdout
+        else:
+            result = subprocess.check_output(command, shell=True, stderr=subprocess.DEVNULL, universal_newlines=True)
+        return result.strip()
+    except (subprocess.SubprocessError, OSError):
+        return None
+
+
+def _json_dumps(obj, indent=False):
+    """Serialize to UTF-8 JSON bytes, through orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    import json                  # Stdlib fallback, only loaded when orjson is missing
+    return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes, through orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(data)
+    import json
+    return json.loads(data)
+
+
+@lru_cache(maxsize=64)
+def _cached_which(command):
+    """Look up a command in PATH once per process without spawning a shell"""
+    return shutil.which(command) is not None
+
+
+# Piped or redirected output (and NO_COLOR) gets plain text without escape codes
+USE_COLOR = sys.stdout.isatty() and os.environ.get('NO_COLOR') is None
+
 
 class Colors:
-    """ANSI color codes for terminal output styling"""
-    HEADER = '\033[95m'      # Purple - Headers and section titles
-    OKBLUE = '\033[94m'      # Blue - Table borders and formatting
-    OKGREEN = '\033[92m'     # Green - Success messages and positive status
-    WARNING = '\033[93m'     # Yellow - Warnings and missing components
-    FAIL = '\033[91m'        # Red - Errors and failures
-    ENDC = '\033[0m'         # Reset - End of color formatting
-    BOLD = '\033[1m'         # Bold - Text emphasis
+    """ANSI color codes for terminal output styling (empty strings when color is off)"""
+    HEADER = '\033[95m' if USE_COLOR else ''      # Purple - Headers and section titles
+    OKBLUE = '\033[94m' if USE_COLOR else ''      # Blue - Table borders and formatting
+    OKGREEN = '\033[92m' if USE_COLOR else ''     # Green - Success messages and positive status
+    WARNING = '\033[93m' if USE_COLOR else ''     # Yellow - Warnings and missing components
+    FAIL = '\033[91m' if USE_COLOR else ''        # Red - Errors and failures
+    ENDC = '\033[0m' if USE_COLOR else ''         # Reset - End of color formatting
+    BOLD = '\033[1m' if USE_COLOR else ''        # Bold - Text emphasis
 
 
 class HardwareFetcher:
     """Comprehensive hardware information gatherer for Linux systems"""
     
-    def __init__(self, verbosity=1, dry_run=False, export_directory='.'):
+    _PCI_RE = re.compile(r'^([0-9a-f:.]+)\s+(.*)')
+    _PCI_CLASS_RE = re.compile(r' \[([0-9a-f]{4})\]:')
+    
+    # Export format -> (file extension, exporter method name)
+    _EXPORTERS = {
+        'json': ('json', 'export_to_json'),
+        'csv': ('csv', 'export_to_csv'),
+        'txt': ('txt', 'export_to_txt'),
+    }
+    _dmi_disk_lock = threading.Lock()
+    
+    # Sections re-collected even when a cached report exists (free memory, SMART health)
+    VOLATILE_SECTIONS = ('RAM Components', 'Storage Devices')
+    
+    def __init__(self, verbosity=1, dry_run=False, export_directory='.', use_cache=True):
         """Initialize HardwareFetcher with configuration"""
         self.verbosity = min(verbosity, 3)
         self.dry_run = dry_run
         self.export_dir = export_directory
-        self.hardware_data = OrderedDict()
+        if not dry_run and export_directory not in ('', '.'):
+            # Create the export directory once here rather than on every export
+            try:
+                os.makedirs(export_directory, exist_ok=True)
+            except OSError:
+                pass
+        self.use_cache = use_cache
+        self.hardware_data = {}
+        self._collected = False
+        self._export_timestamp = None
+        self.tools = {tool: self.command_exists(tool) for tool in ('dmidecode', 'lsblk', 'lspci', 'smartctl', 'nproc')}
+        self._cpu_count = None
+        self._cpuinfo_cache = None
+        self._meminfo_cache = None
+        self._dmi_cache = {}
+        self._dmi_disk_cache = None
+        self._dmi_sysfs_cache = None
+        self._pci_cache = None
+        self._pci_lock = threading.Lock()
+        self._compat = self.check_system_compatibility()
 
     @staticmethod
     def color_text(text, color):
         """Apply ANSI color codes to text for terminal output"""
         return color + str(text) + Colors.ENDC
 
-    @staticmethod
-    def strip_ansi(text):
-        """Remove ANSI color codes from text for width calculations"""
-        ansi_escape = re.compile(r'\033\[[0-9;]*m')
-        return ansi_escape.sub('', str(text))
-
     @staticmethod
     def run_command(command):
-        """Execute shell command safely and return output"""
-        try:
-            result = subprocess.check_output(command, shell=True, stderr=subprocess.DEVNULL, universal_newlines=True)
-            return result.strip()
-        except:
-            return None
+        """Execute command safely and return output (argv lists run without a shell)"""
+        if isinstance(command, list):
+            command = tuple(command)
+        # Concurrent collectors asking for the same command (e.g. lspci) wait for the first run's cached result
+        with _command_lock(command):
+            return _cached_command(command)
 
     @staticmethod
     def command_exists(command):
         """Check if a command exists in system PATH"""
-        return HardwareFetcher.run_command('which ' + command) is not None
+        return _cached_which(command)
+
+    @staticmethod
+    def read_file(filepath, raw=False):
+        """Read file content safely; raw=True returns the unstripped bytes"""
+        try:
+            # Raw fd reads skip TextIOWrapper setup; small sysfs/procfs files arrive in one read
+            fd = os.open(filepath, os.O_RDONLY)
+            try:
+                chunks = [os.read(fd, 4096)]
+                while chunks[-1]:
+                    chunks.append(os.read(fd, 4096))
+            finally:
+                os.close(fd)
+        except OSError:
+            return None
+        data = b''.join(chunks)
+        return data if raw else data.decode('utf-8', 'replace').strip()
 
     @staticmethod
-    def read_file(filepath):
-        """Read file content safely with error handling"""
+    def _read_sysfs(path, raw=False):
+        """Read a small sysfs attribute with a single raw read, or None if unreadable; raw=True keeps bytes"""
         try:
-            with open(filepath, 'r') as f:
-                return f.read().strip()
-        except:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                # Attributes fit in one page, so skip the extra read read_file spends confirming EOF
+                data = os.read(fd, 4096).strip()
+            finally:
+                os.close(fd)
+        except OSError:
             return None
+        return data if raw else data.decode('utf-8', 'replace')
+
+    @staticmethod
+    def _read_sysfs_int(path, default='N/A'):
+        """Read an integer sysfs attribute with a single raw read"""
+        try:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                return int(os.read(fd, 64))
+            finally:
+                os.close(fd)
+        except (OSError, ValueError):
+            return default
+
+    @staticmethod
+    def scan_dir(dirpath):
+        """List directory entries sorted by name, or an empty list if unreadable"""
+        try:
+            return sorted(os.scandir(dirpath), key=lambda entry: entry.name)
+        except OSError:
+            return []
 
     @staticmethod
     def get_value(cmd, fallback_file=None):
@@ -115,136 +254,253 @@ class HardwareFetcher:
                 return result
         return 'N/A'
 
-    def print_header(self, title):
-        """Display formatted section header with hash borders"""
-        border = '#' * 80
+    @staticmethod
+    def format_bytes(size):
+        """Format a byte count as whole GB, MB or KB"""
+        if size >> 30:
+            return f'{size >> 30} GB'
+        if size >> 20:
+            return f'{size >> 20} MB'
+        return f'{size >> 10} KB'
+
+    @staticmethod
+    def dmi_field(record, *keys):
+        """Return the first non-empty value among keys of a parsed DMI record"""
+        for key in keys:
+            value = record.get(key)
+            if value:
+                return value
+        return 'N/A'
+
+    def format_header(self, title):
+        """Build formatted section header with hash borders"""
         padding = (80 - len(title) - 8) // 2
         centered = '### ' + (' ' * padding) + title + (' ' * padding) + ' ###'
-        print(self.color_text(border, Colors.HEADER))
-        print(self.color_text(centered, Colors.HEADER))
-        print(self.color_text(border + '\n', Colors.HEADER))
+        return (self.color_text(HEADER_BORDER, Colors.HEADER) + '\n' +
+                self.color_text(centered, Colors.HEADER) + '\n' +
+                self.color_text(HEADER_BORDER + '\n', Colors.HEADER) + '\n')
 
-    def print_table(self, data):
-        """Print formatted table with aligned columns and separators"""
-        if not data:
-            print(self.color_text("No data available\n", Colors.WARNING))
-            return
+    def print_header(self, title):
+        """Display formatted section header with hash borders"""
+        sys.stdout.write(self.format_header(title))
 
-        col1_width = 28
-        col2_width = 48
-        
-        top_border = '+' + '=' * col1_width + '+' + '=' * col2_width + '+'
-        print(self.color_text(top_border, Colors.OKBLUE))
+    def format_table(self, data):
+        """Build formatted table from any iterable of (key, value) rows, e.g. dict.items()"""
+        separator = self.color_text(TABLE_SEPARATOR, Colors.OKBLUE)
+        lines = [self.color_text(TABLE_BORDER, Colors.OKBLUE)]
 
-        for idx, row in enumerate(data):
+        # Rows are streamed, so separators go before every row but the first
+        for row in data:
             if len(row) >= 2:
-                col1_text = str(row[0])
-                col2_text = str(row[1])
-                
-                col1_clean = self.strip_ansi(col1_text)
-                col2_clean = self.strip_ansi(col2_text)
-                
-                if len(col1_clean) > col1_width - 3:
-                    col1_clean = col1_clean[:col1_width - 6] + '...'
-                if len(col2_clean) > col2_width - 3:
-                    col2_clean = col2_clean[:col2_width - 6] + '...'
-                
-                col1_padded = col1_clean.ljust(col1_width - 2)
-                col2_padded = col2_clean.ljust(col2_width - 2)
-                
-                print('| ' + col1_padded + ' | ' + col2_padded + ' |')
-                
-                if idx < len(data) - 1:
-                    separator = '+' + '-' * col1_width + '+' + '-' * col2_width + '+'
-                    print(self.color_text(separator, Colors.OKBLUE))
+                if len(lines) > 1:
+                    lines.append(separator)
+                # Cells are raw collected values; color is only ever applied to borders.
+                # Only overlong cells are sliced, padding is left to the prebuilt row format
+                col1 = str(row[0])
+                col2 = str(row[1])
+                if len(col1) > COL1_WIDTH - 3:
+                    col1 = col1[:COL1_WIDTH - 6] + '...'
+                if len(col2) > COL2_WIDTH - 3:
+                    col2 = col2[:COL2_WIDTH - 6] + '...'
+                lines.append(TABLE_ROW_FORMAT.format(col1, col2))
+
+        if len(lines) == 1:
+            return self.color_text("No data available\n", Colors.WARNING) + '\n'
 
-        bottom_border = '+' + '=' * col1_width + '+' + '=' * col2_width + '+'
-        print(self.color_text(bottom_border + '\n', Colors.OKBLUE))
+        lines.append(self.color_text(TABLE_BORDER + '\n', Colors.OKBLUE))
+        return '\n'.join(lines) + '\n'
+
+    def print_table(self, data):
+        """Print formatted table from any iterable of (key, value) rows, e.g. dict.items()"""
+        # Emit the whole table in one write instead of one print per line
+        sys.stdout.write(self.format_table(data))
 
     def check_system_compatibility(self):
         """Check system compatibility for hardware detection"""
         checks = {
             'procfs': os.path.exists('/proc/cpuinfo'),
             'sysfs': os.path.exists('/sys/devices/system/cpu/'),
-            'dmidecode': self.command_exists('dmidecode'),
-            'lsblk': self.command_exists('lsblk'),
-            'lspci': self.command_exists('lspci'),
-            'smartctl': self.command_exists('smartctl'),
+            'dmidecode': self.tools['dmidecode'],
+            'lsblk': self.tools['lsblk'],
+            'lspci': self.tools['lspci'],
+            'smartctl': self.tools['smartctl'],
         }
         return checks
 
     def print_compatibility_check(self):
         """Display system compatibility check results"""
-        checks = self.check_system_compatibility()
-        self.print_header('SYSTEM COMPATIBILITY CHECK')
-        
-        for check_name, result in checks.items():
-            status = self.color_text('✓ OK', Colors.OKGREEN) if result else self.color_text('✗ MISSING', Colors.WARNING)
-            print(f'{check_name.ljust(20)} : {status}')
-        
-        print()
+        checks = self._compat
+        ok = self.color_text('✓ OK', Colors.OKGREEN)
+        missing = self.color_text('✗ MISSING', Colors.WARNING)
         
-        if not checks['procfs']:
-            print(self.color_text('ERROR: /proc/cpuinfo not found. System not compatible!\n', Colors.FAIL))
-            return False
+        # Header, check lines and verdict go out in a single write
+        out = [self.format_header('SYSTEM COMPATIBILITY CHECK')]
+        out.extend(f'{check_name.ljust(20)} : {ok if result else missing}\n' for check_name, result in checks.items())
+        out.append('\n')
         
-        print(self.color_text('[+] System is ABLE TO RUN - Required components detected!\n', Colors.OKGREEN))
-        return True
+        compatible = checks['procfs']
+        if compatible:
+            out.append(self.color_text('[+] System is ABLE TO RUN - Required components detected!\n', Colors.OKGREEN))
+        else:
+            out.append(self.color_text('ERROR: /proc/cpuinfo not found. System not compatible!\n', Colors.FAIL))
+        out.append('\n')
+        sys.stdout.write(''.join(out))
+        return compatible
+
+    def _parse_cpuinfo(self):
+        """Read /proc/cpuinfo once and parse the first processor block into a dict"""
+        if self._cpuinfo_cache is None:
+            # procfs reports st_size 0 and cannot be mmapped, so read raw bytes, count processors
+            # on those and decode only the first processor block
+            raw = self.read_file('/proc/cpuinfo', raw=True) or b''
+            self._cpu_count = (b'\n' + raw).count(b'\nprocessor\t')
+            self._cpuinfo_cache = {}
+            end = raw.find(b'\n\n')
+            first_block = (raw if end == -1 else raw[:end]).decode('utf-8', 'replace')
+            for line in first_block.split('\n'):
+                if ':' in line:
+                    key, value = line.split(':', 1)
+                    self._cpuinfo_cache[key.strip()] = value.strip()
+        return self._cpuinfo_cache
+
+    def _parse_meminfo(self):
+        """Read /proc/meminfo once and parse it into a {label: value_in_kB} dict"""
+        if self._meminfo_cache is None:
+            meminfo = {}
+            for line in (self.read_file('/proc/meminfo') or '').splitlines():
+                name, _, rest = line.partition(':')
+                fields = rest.split()
+                if fields:
+                    meminfo[name] = int(fields[0])
+            self._meminfo_cache = meminfo
+        return self._meminfo_cache
+
+    def _dmi(self, dmi_type):
+        """Run dmidecode once per DMI table type and cache its raw output"""
+        if dmi_type not in self._dmi_cache:
+            output = self._load_dmi_disk_cache(dmi_type)
+            if output is None:
+                output = self.run_command(['dmidecode', '-t', dmi_type]) or ''
+                if output:
+                    self._save_dmi_disk_cache(dmi_type, output)
+            self._dmi_cache[dmi_type] = output
+        return self._dmi_cache[dmi_type]
+
+    def _load_dmi_disk_cache(self, dmi_type):
+        """Return dmidecode output cached on disk by an earlier run in this boot, or None if missing"""
+        if not self.use_cache:
+            return None
+        with self._dmi_disk_lock:
+            if self._dmi_disk_cache is None:
+                cache_file = self._cache_file('dmi')
+                try:
+                    cached = _json_loads(self.read_file(cache_file, raw=True) or b'{}') if cache_file else {}
+                except ValueError:
+                    cached = {}
+                self._dmi_disk_cache = cached if isinstance(cached, dict) else {}
+            output = self._dmi_disk_cache.get(dmi_type)
+        return output if isinstance(output, str) else None
+
+    def _save_dmi_disk_cache(self, dmi_type, output):
+        """Persist dmidecode output so later runs can skip the dmidecode call"""
+        with self._dmi_disk_lock:
+            if self._dmi_disk_cache is None:
+                self._dmi_disk_cache = {}
+            self._dmi_disk_cache[dmi_type] = output
+            cache_file = self._cache_file('dmi')
+            if not cache_file:
+                return
+            try:
+                self._write_cache_file(cache_file, _json_dumps(self._dmi_disk_cache))
+            except OSError:
+                pass
+
+    @staticmethod
+    def _write_cache_file(cache_file, payload):
+        """Atomically replace a cache file, readable only by the current user"""
+        # dmidecode output and -vvv reports carry root-only serial numbers
+        os.makedirs(CACHE_DIR, mode=0o700, exist_ok=True)
+        temp_file = cache_file + '.tmp'
+        try:
+            os.unlink(temp_file)     # A leftover temp file would keep its old mode
+        except FileNotFoundError:
+            pass
+        HardwareFetcher.write_file(temp_file, payload, mode=0o600)
+        os.replace(temp_file, cache_file)
+
+    def _dmi_records(self, dmi_type, title):
+        """Parse cached dmidecode output into key/value dicts for records with the given title"""
+        records = []
+        for block in self._dmi(dmi_type).split('\n\n'):
+            lines = block.strip('\n').split('\n')
+            # Each record is a 'Handle ...' line, the record title, then tab-indented fields
+            if len(lines) < 2 or not lines[0].startswith('Handle') or lines[1].strip() != title:
+                continue
+            record = {}
+            for line in lines[2:]:
+                if line.startswith('\t\t') or ':' not in line:
+                    continue
+                key, value = line.split(':', 1)
+                record[key.strip()] = value.strip()
+            records.append(record)
+        return records
+
+    def _read_cpufreq_mhz(self, attribute):
+        """Read a cpu0 cpufreq attribute (reported in kHz) as a MHz string"""
+        khz = self._read_sysfs_int('/sys/devices/system/cpu/cpu0/cpufreq/' + attribute, None)
+        return 'N/A' if khz is None else str(khz // 1000)
 
     def get_cpu_components(self):
         """Retrieve detailed CPU hardware information"""
-        data = OrderedDict()
+        data = {}
         
         try:
+            cpuinfo = self._parse_cpuinfo()
+            
             # Level 1: Basic CPU information
-            cpu_count = self.get_value("grep -c '^processor' /proc/cpuinfo")
-            if cpu_count != 'N/A':
-                data['Physical CPU Count'] = cpu_count.split('\n')[0]
-            else:
-                data['Physical CPU Count'] = 'N/A'
+            data['Physical CPU Count'] = str(self._cpu_count) if self._cpu_count else 'N/A'
+            
+            data['CPU Model'] = cpuinfo.get('model name') or 'N/A'
+            data['CPU Vendor'] = cpuinfo.get('vendor_id') or 'N/A'
+            data['Total CPU Cores'] = self.get_value(['nproc'])
             
-            data['CPU Model'] = self.get_value("grep -m 1 'model name' /proc/cpuinfo | cut -d: -f2 | xargs")
-            data['CPU Vendor'] = self.get_value("grep -m 1 'vendor_id' /proc/cpuinfo | cut -d: -f2 | xargs")
-            data['Total CPU Cores'] = self.get_value("nproc")
+            # Flags line is looked up and split once, then shared by the level 2 and 3 checks
+            flags = cpuinfo.get('flags', '')
+            flags_set = frozenset(flags.split()) if self.verbosity >= 2 else frozenset()
             
             if self.verbosity >= 2:
                 # Level 2: Extended CPU details
-                data['CPU Stepping'] = self.get_value("grep -m 1 'stepping' /proc/cpuinfo | cut -d: -f2 | xargs")
-                data['CPU Family'] = self.get_value("grep -m 1 'cpu family' /proc/cpuinfo | cut -d: -f2 | xargs")
-                data['CPU Model Number'] = self.get_value("grep -m 1 '^model' /proc/cpuinfo | grep -v 'model name' | cut -d: -f2 | xargs")
-                data['L3 Cache Size'] = self.get_value("grep -m 1 'cache size' /proc/cpuinfo | cut -d: -f2 | xargs")
-                data['Cores Per Socket'] = self.get_value("grep -m 1 'cpu cores' /proc/cpuinfo | cut -d: -f2 | xargs")
-                data['Threads (Siblings)'] = self.get_value("grep -m 1 'siblings' /proc/cpuinfo | cut -d: -f2 | xargs")
-                data['Current Frequency (MHz)'] = self.get_value("grep -m 1 'cpu MHz' /proc/cpuinfo | cut -d: -f2 | xargs")
-                data['Max Frequency (MHz)'] = self.get_value(None, '/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq')
-                data['Min Frequency (MHz)'] = self.get_value(None, '/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_min_freq')
+                data['CPU Stepping'] = cpuinfo.get('stepping') or 'N/A'
+                data['CPU Family'] = cpuinfo.get('cpu family') or 'N/A'
+                data['CPU Model Number'] = cpuinfo.get('model') or 'N/A'
+                data['L3 Cache Size'] = cpuinfo.get('cache size') or 'N/A'
+                data['Cores Per Socket'] = cpuinfo.get('cpu cores') or 'N/A'
+                data['Threads (Siblings)'] = cpuinfo.get('siblings') or 'N/A'
+                data['Current Frequency (MHz)'] = cpuinfo.get('cpu MHz') or 'N/A'
+                data['Max Frequency (MHz)'] = self._read_cpufreq_mhz('cpuinfo_max_freq')
+                data['Min Frequency (MHz)'] = self._read_cpufreq_mhz('cpuinfo_min_freq')
                 
                 # Virtualization support
-                flags_cmd = "grep -m 1 'flags' /proc/cpuinfo | cut -d: -f2 | xargs"
-                flags_output = self.get_value(flags_cmd)
-                data['VMX Support (Intel)'] = 'Yes' if 'vmx' in flags_output else 'No'
-                data['SVM Support (AMD)'] = 'Yes' if 'svm' in flags_output else 'No'
+                data['VMX Support (Intel)'] = 'Yes' if 'vmx' in flags_set else 'No'
+                data['SVM Support (AMD)'] = 'Yes' if 'svm' in flags_set else 'No'
             
             if self.verbosity >= 3:
                 # Level 3: Deep CPU analysis
-                flags = self.get_value("grep -m 1 'flags' /proc/cpuinfo | cut -d: -f2 | xargs")
-                if flags != 'N/A':
-                    flags_list = flags.split()
-                    data['CPU Extensions (Count)'] = str(len(flags_list))
+                if flags:
+                    data['CPU Extensions (Count)'] = str(len(flags_set))
                     data['All CPU Flags'] = flags[:100] + ('...' if len(flags) > 100 else '')
                     
-                    important = ['vmx', 'svm', 'avx', 'avx2', 'sse4_2', 'aes', 'rdrand', 'tsx']
-                    found = [f for f in important if f in flags_list]
-                    data['Important Extensions'] = ', '.join(found) if found else 'None'
+                    found = IMPORTANT_CPU_FLAGS & flags_set
+                    data['Important Extensions'] = ', '.join(sorted(found)) or 'None'
                 
-                data['Microcode'] = self.get_value("grep -m 1 'microcode' /proc/cpuinfo | cut -d: -f2 | xargs")
-                data['APIC ID'] = self.get_value("grep -m 1 'apicid' /proc/cpuinfo | cut -d: -f2 | xargs")
-                data['Physical ID'] = self.get_value("grep -m 1 'physical id' /proc/cpuinfo | cut -d: -f2 | xargs")
-                data['Core ID'] = self.get_value("grep -m 1 'core id' /proc/cpuinfo | cut -d: -f2 | xargs")
-                data['FPU Present'] = self.get_value("grep -m 1 'fpu[^_]' /proc/cpuinfo | cut -d: -f2 | xargs")
+                data['Microcode'] = cpuinfo.get('microcode') or 'N/A'
+                data['APIC ID'] = cpuinfo.get('apicid') or 'N/A'
+                data['Physical ID'] = cpuinfo.get('physical id') or 'N/A'
+                data['Core ID'] = cpuinfo.get('core id') or 'N/A'
+                data['FPU Present'] = cpuinfo.get('fpu') or 'N/A'
                 
-                bugs = self.get_value("grep 'bugs' /proc/cpuinfo | head -1 | cut -d: -f2 | xargs")
-                if bugs != 'N/A':
+                bugs = cpuinfo.get('bugs')
+                if bugs:
                     data['Known CPU Bugs'] = bugs[:80] + ('...' if len(bugs) > 80 else '')
         
         except Exception as e:
@@ -254,173 +510,268 @@ class HardwareFetcher:
 
     def get_ram_components(self):
         """Retrieve detailed RAM hardware information"""
-        data = OrderedDict()
+        data = {}
         
         try:
-            meminfo = self.read_file('/proc/meminfo')
-            if meminfo:
-                for line in meminfo.split('\n'):
-                    if line.startswith('MemTotal:'):
-                        kb = int(line.split()[1])
-                        data['Total RAM'] = str(kb // (1024 * 1024)) + ' GB'
-                        break
+            meminfo = self._parse_meminfo()
+            if 'MemTotal' in meminfo:
+                data['Total RAM'] = f"{meminfo['MemTotal'] >> 20} GB"
             
-            if self.command_exists('dmidecode'):
-                ram_modules = self.get_value("dmidecode -t memory | grep -c 'Memory Device'")
-                data['Physical RAM Modules'] = ram_modules
+            if self.tools['dmidecode']:
+                modules = self._dmi_records('memory', 'Memory Device')
+                data['Physical RAM Modules'] = str(len(modules))
+                
+                # Describe the first populated slot, falling back to the first slot listed
+                installed = [m for m in modules if m.get('Size', '').lower() not in ('', 'no module installed')]
+                module = (installed or modules or [{}])[0]
+                arrays = self._dmi_records('memory', 'Physical Memory Array')
+                array = arrays[0] if arrays else {}
                 
                 if self.verbosity >= 2:
-                    data['RAM Speed'] = self.get_value("dmidecode -t memory | grep -m 1 'Speed' | cut -d: -f2 | xargs")
-                    data['RAM Type'] = self.get_value("dmidecode -t memory | grep -m 1 'Type:' | cut -d: -f2 | xargs")
-                    data['Form Factor'] = self.get_value("dmidecode -t memory | grep -m 1 'Form Factor' | cut -d: -f2 | xargs")
-                    data['Data Width'] = self.get_value("dmidecode -t memory | grep -m 1 'Data Width' | cut -d: -f2 | xargs")
-                    data['Voltage'] = self.get_value("dmidecode -t memory | grep -m 1 'Voltage' | cut -d: -f2 | xargs")
-                    data['Error Correction'] = self.get_value("dmidecode -t memory | grep -m 1 'Error Correction Type' | cut -d: -f2 | xargs")
+                    data['RAM Speed'] = self.dmi_field(module, 'Speed')
+                    data['RAM Type'] = self.dmi_field(module, 'Type')
+                    data['Form Factor'] = self.dmi_field(module, 'Form Factor')
+                    data['Data Width'] = self.dmi_field(module, 'Data Width')
+                    data['Voltage'] = self.dmi_field(module, 'Configured Voltage', 'Minimum Voltage')
+                    data['Error Correction'] = self.dmi_field(array, 'Error Correction Type')
                 
                 if self.verbosity >= 3:
-                    data['Manufacturer'] = self.get_value("dmidecode -t memory | grep -m 1 'Manufacturer' | cut -d: -f2 | xargs")
-                    data['Module Serial'] = self.get_value("dmidecode -t memory | grep -m 1 'Serial Number' | cut -d: -f2 | xargs")
-                    data['Part Number'] = self.get_value("dmidecode -t memory | grep -m 1 'Part Number' | cut -d: -f2 | xargs")
-                    data['Configured Speed'] = self.get_value("dmidecode -t memory | grep -m 1 'Configured Clock Speed' | cut -d: -f2 | xargs")
+                    data['Manufacturer'] = self.dmi_field(module, 'Manufacturer')
+                    data['Module Serial'] = self.dmi_field(module, 'Serial Number')
+                    data['Part Number'] = self.dmi_field(module, 'Part Number')
+                    data['Configured Speed'] = self.dmi_field(module, 'Configured Memory Speed', 'Configured Clock Speed')
             
             # Available memory info
-            if meminfo:
-                for line in meminfo.split('\n'):
-                    if line.startswith('MemAvailable:'):
-                        kb = int(line.split()[1])
-                        data['Available RAM'] = str(kb // (1024 * 1024)) + ' GB'
-                    elif line.startswith('Cached:'):
-                        kb = int(line.split()[1])
-                        data['Cached Memory'] = str(kb // 1024) + ' MB'
+            if 'MemAvailable' in meminfo:
+                data['Available RAM'] = f"{meminfo['MemAvailable'] >> 20} GB"
+            if 'Cached' in meminfo:
+                data['Cached Memory'] = f"{meminfo['Cached'] >> 10} MB"
         
         except Exception as e:
             data['Error'] = str(e)
         
         return data
 
+    def _sysfs_dmi(self):
+        """Read every readable /sys/devices/virtual/dmi/id attribute into a dict once, or None if absent"""
+        if self._dmi_sysfs_cache is None:
+            entries = self.scan_dir('/sys/devices/virtual/dmi/id')
+            if not entries:
+                return None
+            # Root-only attributes such as product_serial fail to open and are simply left out
+            self._dmi_sysfs_cache = {}
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    value = self._read_sysfs(entry.path)
+                    if value is not None:
+                        self._dmi_sysfs_cache[entry.name] = value
+        return self._dmi_sysfs_cache
+
     def get_motherboard_info(self):
         """Retrieve motherboard and system information"""
-        data = OrderedDict()
+        data = {}
         
         try:
-            if self.command_exists('dmidecode'):
-                data['Motherboard Manufacturer'] = self.get_value("dmidecode -t baseboard | grep Manufacturer | head -1 | cut -d: -f2 | xargs")
-                data['Motherboard Model'] = self.get_value("dmidecode -t baseboard | grep 'Product Name' | head -1 | cut -d: -f2 | xargs")
-                data['System Manufacturer'] = self.get_value("dmidecode -t system | grep Manufacturer | head -1 | cut -d: -f2 | xargs")
+            if self.tools['dmidecode']:
+                baseboard = (self._dmi_records('baseboard', 'Base Board Information') or [{}])[0]
+                system = (self._dmi_records('system', 'System Information') or [{}])[0]
+                bios = chassis = {}
+                
+                data['Motherboard Manufacturer'] = self.dmi_field(baseboard, 'Manufacturer')
+                data['Motherboard Model'] = self.dmi_field(baseboard, 'Product Name')
+                data['System Manufacturer'] = self.dmi_field(system, 'Manufacturer')
                 
                 if self.verbosity >= 2:
-                    data['BIOS Vendor'] = self.get_value("dmidecode -t bios | grep Vendor | head -1 | cut -d: -f2 | xargs")
-                    data['BIOS Version'] = self.get_value("dmidecode -t bios | grep Version | head -1 | cut -d: -f2 | xargs")
-                    data['BIOS Release Date'] = self.get_value("dmidecode -t bios | grep 'Release Date' | cut -d: -f2 | xargs")
-                    data['Chassis Type'] = self.get_value("dmidecode -t chassis | grep Type | head -1 | cut -d: -f2 | xargs")
-                    data['System Product'] = self.get_value("dmidecode -t system | grep 'Product Name' | head -1 | cut -d: -f2 | xargs")
+                    bios = (self._dmi_records('bios', 'BIOS Information') or [{}])[0]
+                    chassis = (self._dmi_records('chassis', 'Chassis Information') or [{}])[0]
+                    data['BIOS Vendor'] = self.dmi_field(bios, 'Vendor')
+                    data['BIOS Version'] = self.dmi_field(bios, 'Version')
+                    data['BIOS Release Date'] = self.dmi_field(bios, 'Release Date')
+                    data['Chassis Type'] = self.dmi_field(chassis, 'Type')
+                    data['System Product'] = self.dmi_field(system, 'Product Name')
                 
                 if self.verbosity >= 3:
-                    data['System Serial'] = self.get_value("dmidecode -t system | grep 'Serial Number' | head -1 | cut -d: -f2 | xargs")
-                    data['Motherboard Serial'] = self.get_value("dmidecode -t baseboard | grep 'Serial Number' | head -1 | cut -d: -f2 | xargs")
-                    data['Chassis Serial'] = self.get_value("dmidecode -t chassis | grep 'Serial Number' | head -1 | cut -d: -f2 | xargs")
-                    data['System SKU'] = self.get_value("dmidecode -t system | grep SKU | cut -d: -f2 | xargs")
-                    data['BIOS ROM Size'] = self.get_value("dmidecode -t bios | grep 'ROM Size' | cut -d: -f2 | xargs")
+                    data['System Serial'] = self.dmi_field(system, 'Serial Number')
+                    data['Motherboard Serial'] = self.dmi_field(baseboard, 'Serial Number')
+                    data['Chassis Serial'] = self.dmi_field(chassis, 'Serial Number')
+                    data['System SKU'] = self.dmi_field(system, 'SKU Number')
+                    data['BIOS ROM Size'] = self.dmi_field(bios, 'ROM Size')
             else:
-                dmi_path = '/sys/devices/virtual/dmi/id/'
-                if os.path.exists(dmi_path):
-                    data['System Manufacturer'] = self.read_file(dmi_path + 'sys_vendor') or 'N/A'
-                    data['System Product'] = self.read_file(dmi_path + 'product_name') or 'N/A'
-                    data['Motherboard Vendor'] = self.read_file(dmi_path + 'board_vendor') or 'N/A'
-                    data['Motherboard Model'] = self.read_file(dmi_path + 'board_name') or 'N/A'
+                dmi = self._sysfs_dmi()
+                if dmi is not None:
+                    for label, attribute in (('System Manufacturer', 'sys_vendor'), ('System Product', 'product_name'),
+                                             ('Motherboard Vendor', 'board_vendor'), ('Motherboard Model', 'board_name')):
+                        data[label] = dmi.get(attribute) or 'N/A'
         
         except Exception as e:
             data['Error'] = str(e)
         
         return data
 
+    def _block_device_type(self, entry):
+        """Derive the lsblk TYPE of a /sys/block entry (disk, rom, raid*, lvm, crypt, mpath or dm)"""
+        name = entry.name
+        if name.startswith('sr'):
+            return 'rom'
+        if name.startswith('md'):
+            return self._read_sysfs(entry.path + '/md/level') or 'md'
+        if name.startswith('dm-'):
+            # Device-mapper targets are told apart by their UUID prefix (LVM-..., CRYPT-..., mpath-...)
+            uuid = self._read_sysfs(entry.path + '/dm/uuid') or ''
+            prefix = uuid.split('-', 1)[0].lower()
+            return prefix if prefix in ('lvm', 'crypt', 'mpath') else 'dm'
+        return 'disk'
+
+    def _read_block_device(self, entry):
+        """Read one /sys/block entry in the same shape as an lsblk JSON entry, or None if unreadable"""
+        sectors = self._read_sysfs_int(entry.path + '/size', None)
+        if sectors is None:
+            return None
+        device = {
+            'name': entry.name,
+            'type': self._block_device_type(entry),
+            'size': sectors << 9,         # 512-byte sectors
+            'rota': self._read_sysfs_int(entry.path + '/queue/rotational', None),
+            'model': self._read_sysfs(entry.path + '/device/model'),
+        }
+        if self.verbosity >= 2:
+            # Partitions are subdirectories named after the disk (sda1, nvme0n1p1), found in the same scan
+            device['children'] = []
+            for child in self.scan_dir(entry.path):
+                if child.name.startswith(entry.name) and child.is_dir(follow_symlinks=False):
+                    part_sectors = self._read_sysfs_int(child.path + '/size', None)
+                    if part_sectors is not None:
+                        device['children'].append({'name': child.name, 'size': part_sectors << 9, 'type': 'part'})
+        return device
+
+    def _sysfs_block_devices(self):
+        """List block devices from /sys/block in the same shape as lsblk JSON entries"""
+        entries = [entry for entry in self.scan_dir('/sys/block') if not entry.name.startswith(SKIPPED_BLOCK_PREFIXES)]
+        # sysfs attribute reads never block, so a thread pool would cost more than the reads themselves
+        return [device for device in map(self._read_block_device, entries) if device]
+
+    def _smart_status(self, disk):
+        """Return the SMART overall-health result for a disk, or None if unavailable"""
+        smart_output = self.run_command(['smartctl', '-H', '/dev/' + disk]) or ''
+        for line in smart_output.split('\n'):
+            if 'SMART overall' in line:
+                return line.split()[-1]
+        return None
+
     def get_storage_components(self):
         """Retrieve storage device information"""
         data = []
         
         try:
-            block_output = self.get_value("lsblk -d -o NAME,SIZE,TYPE,ROTA,MODEL 2>/dev/null")
+            block_devices = []
+            partitions = []
+            if self.verbosity >= 2 and self.tools['lsblk']:
+                # One JSON listing carries disks and their partition trees
+                lsblk_output = self.run_command(['lsblk', '-J', '-b', '-o', 'NAME,SIZE,TYPE,ROTA,MODEL,MOUNTPOINT'])
+                if lsblk_output:
+                    # Same devices and order as the sysfs listing, so the disk list does not change with verbosity
+                    block_devices = sorted((device for device in _json_loads(lsblk_output).get('blockdevices', [])
+                                            if not device['name'].startswith(SKIPPED_BLOCK_PREFIXES)),
+                                           key=lambda device: device['name'])
             
-            if block_output and block_output != 'N/A':
-                lines = block_output.split('\n')
-                for i, line in enumerate(lines):
-                    if i > 0 and line.strip():
-                        parts = line.split(None, 4)
-                        if len(parts) >= 2:
-                            name = parts[0]
-                            size = parts[1]
-                            rota = parts[3] if len(parts) > 3 else 'N/A'
-                            model = parts[4] if len(parts) > 4 else 'Virtual'
-                            
-                            disk_type = 'SSD' if rota == '0' else 'HDD' if rota == '1' else 'UNKNOWN'
-                            disk_info = size + ' [' + disk_type + '] ' + model
-                            data.append(['/dev/' + name, disk_info])
+            # Basic listings (and systems without lsblk) only need sysfs
+            if not block_devices:
+                block_devices = self._sysfs_block_devices()
             
-            # Fallback to /sys/block/
-            if not data:
-                sys_block = '/sys/block/'
-                if os.path.exists(sys_block):
-                    for device in sorted(os.listdir(sys_block)):
-                        if not device.startswith('loop'):
-                            device_path = os.path.join(sys_block, device)
-                            size_file = os.path.join(device_path, 'size')
-                            if os.path.exists(size_file):
-                                size_kb = int(self.read_file(size_file) or '0') // 2
-                                if size_kb > 1024:
-                                    size_str = str(size_kb // 1024) + ' MB'
-                                else:
-                                    size_str = str(size_kb) + ' KB'
-                                data.append(['/dev/' + device, size_str])
+            for device in block_devices:
+                rota = device.get('rota')
+                disk_type = 'SSD' if rota in (0, '0') else 'HDD' if rota in (1, '1') else 'UNKNOWN'
+                model = (device.get('model') or '').strip() or 'Virtual'
+                disk_info = self.format_bytes(int(device.get('size') or 0)) + ' [' + disk_type + '] ' + model
+                data.append(['/dev/' + device['name'], disk_info])
+                
+                children = list(device.get('children', []))
+                while children:
+                    child = children.pop(0)
+                    if child.get('type') == 'part':
+                        part_info = child['name'] + ' ' + self.format_bytes(int(child.get('size') or 0))
+                        if child.get('mountpoint'):
+                            part_info += ' ' + child['mountpoint']
+                        partitions.append(['   └─ PARTITION', part_info[:42]])
+                    children.extend(child.get('children', []))
             
             # Partitions if verbosity >= 2
             if self.verbosity >= 2:
-                part_output = self.get_value("lsblk 2>/dev/null | grep 'part'")
-                if part_output and part_output != 'N/A':
-                    for line in part_output.split('\n'):
-                        if line.strip():
-                            data.append(['   └─ PARTITION', line.strip()[:42]])
+                data.extend(partitions)
             
             # SMART info if verbosity >= 3
-            if self.verbosity >= 3 and self.command_exists('smartctl'):
-                disks = self.get_value("lsblk -d -o NAME 2>/dev/null | grep -v NAME | head -2")
-                if disks and disks != 'N/A':
-                    for disk in disks.split('\n'):
-                        if disk.strip():
-                            health = self.get_value(f"smartctl -H /dev/{disk.strip()} 2>/dev/null | grep 'SMART overall'")
-                            if health != 'N/A':
-                                status = health.split()[-1] if health else 'N/A'
-                                data.append([f"   └─ {disk.strip()} [SMART]", f"Status: {status}"])
+            if self.verbosity >= 3 and self.tools['smartctl']:
+                # Only physical disks answer SMART; zram is compressed memory and has none
+                disks = [device['name'] for device in block_devices
+                         if device.get('type') == 'disk' and not device['name'].startswith('zram')]
+                if disks:
+                    # smartctl blocks on device wake-up and passthrough, so query disks concurrently
+                    with ThreadPoolExecutor(max_workers=min(8, len(disks))) as executor:
+                        statuses = list(executor.map(self._smart_status, disks))
+                    for disk, status in zip(disks, statuses):
+                        if status:
+                            data.append([f"   └─ {disk} [SMART]", f"Status: {status}"])
         
         except Exception as e:
             pass
         
         return data
 
-    def get_pci_devices(self):
-        """Retrieve PCI device information"""
+    def _lspci_devices(self, filter_class=None):
+        """Parse 'lspci -nn' into [slot, description] rows, optionally keeping only some PCI base classes"""
+        data = []
+        pci_output = self.get_value(['lspci', '-nn']) if self.tools['lspci'] else 'N/A'
+        if pci_output != 'N/A':
+            for line in pci_output.split('\n'):
+                match = self._PCI_RE.match(line)
+                if not match:
+                    continue
+                class_match = self._PCI_CLASS_RE.search(match.group(2))
+                if filter_class and (not class_match or not class_match.group(1).startswith(filter_class)):
+                    continue
+                # The class code is only needed for filtering; keep the vendor:device IDs for display
+                data.append([match.group(1), self._PCI_CLASS_RE.sub(':', match.group(2), count=1)])
+        return data
+
+    def _read_pci_device(self, entry):
+        """Read one /sys/bus/pci/devices entry as (slot, class code bytes, 'vendor:device'), or None if unreadable"""
+        # Attributes are ASCII hex, so they stay bytes and only the displayed ID string is decoded
+        pci_class = self._read_sysfs(entry.path + '/class', raw=True) or b''
+        vendor = self._read_sysfs(entry.path + '/vendor', raw=True)
+        dev_id = self._read_sysfs(entry.path + '/device', raw=True)
+        if vendor and dev_id:
+            return (entry.name, pci_class[2:], (vendor + b':' + dev_id).decode('ascii', 'replace'))
+        return None
+
+    def _scan_pci(self):
+        """Scan PCI sysfs once per collection; the PCI and GPU collectors share the result"""
+        with self._pci_lock:
+            if self._pci_cache is None:
+                entries = self.scan_dir('/sys/bus/pci/devices')
+                self._pci_cache = [device for device in map(self._read_pci_device, entries) if device]
+            return self._pci_cache
+
+    def _sysfs_pci_devices(self, filter_class=None):
+        """List PCI devices from sysfs as [slot, 'vendor:device'] rows, optionally limited to base-class codes"""
+        if filter_class:
+            filter_class = tuple(code.encode('ascii') for code in filter_class)
+        return [[slot, ids] for slot, pci_class, ids in self._scan_pci()
+                if not filter_class or pci_class.startswith(filter_class)]
+
+    def get_pci_devices(self, filter_class=None):
+        """Retrieve PCI device information, limited to the given base-class codes (e.g. '02') if set"""
         data = []
         
         try:
-            pci_output = self.get_value("lspci 2>/dev/null")
-            
-            if pci_output and pci_output != 'N/A':
-                for line in pci_output.split('\n'):
-                    if line.strip():
-                        match = re.match(r'^([0-9a-f:.]+)\s+(.*)', line)
-                        if match:
-                            data.append([match.group(1), match.group(2)])
+            # Accept a single class code ('02') as well as a collection of them
+            if isinstance(filter_class, str):
+                filter_class = (filter_class,)
+            filter_class = tuple(filter_class) if filter_class else None
+            data = self._lspci_devices(filter_class)
             
             # Fallback to /sys/bus/pci/
             if not data:
-                pci_path = '/sys/bus/pci/devices/'
-                if os.path.exists(pci_path):
-                    for device in sorted(os.listdir(pci_path)):
-                        vendor_file = os.path.join(pci_path, device, 'vendor')
-                        device_file = os.path.join(pci_path, device, 'device')
-                        if os.path.exists(vendor_file) and os.path.exists(device_file):
-                            vendor = self.read_file(vendor_file)
-                            dev_id = self.read_file(device_file)
-                            data.append([device, vendor + ':' + dev_id])
+                data = self._sysfs_pci_devices(filter_class)
         
         except Exception as e:
             pass
@@ -432,20 +783,42 @@ class HardwareFetcher:
         data = []
         
         try:
-            gpu_output = self.get_value("lspci 2>/dev/null | grep -i 'vga\\|3d\\|display\\|graphics'")
+            # From level 2 the PCI section runs lspci anyway, so reuse its memoized output and
+            # list GPUs by name, the same way the PCI section does
+            use_lspci = self.verbosity >= 2 and self.tools['lspci']
+            if use_lspci:
+                data = self._lspci_devices(('03',))
             
-            if gpu_output and gpu_output != 'N/A':
-                for line in gpu_output.split('\n'):
-                    if line.strip():
-                        match = re.match(r'^([0-9a-f:.]+)\s+(.*)', line)
-                        if match:
-                            data.append([match.group(1), match.group(2)])
+            # Display controllers are PCI class 0x03; sysfs lists them without running lspci
+            if not data:
+                pci_devices = self._scan_pci()
+                data = [[slot, ids] for slot, pci_class, ids in pci_devices if pci_class.startswith(b'03')]
+                # A system without PCI sysfs can still be covered by lspci, if not tried above
+                if not pci_devices and not use_lspci:
+                    data = self._lspci_devices(('03',))
         
         except Exception as e:
             pass
         
         return data
 
+    @staticmethod
+    def write_file(filepath, payload, mode=0o644):
+        """Write a pre-serialized bytes payload to a file in as few write calls as possible"""
+        flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+        try:
+            fd = os.open(filepath, flags, mode)
+        except FileNotFoundError:
+            # Only paths outside the pre-created export directory need their parent created
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            fd = os.open(filepath, flags, mode)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+
     def export_to_json(self, filepath):
         """Export hardware data to JSON file"""
         try:
@@ -453,15 +826,23 @@ class HardwareFetcher:
                 print(self.color_text(f'[DRY-RUN] Would export JSON to: {filepath}', Colors.OKBLUE))
                 return True
             
-            os.makedirs(os.path.dirname(filepath) if os.path.dirname(filepath) else '.', exist_ok=True)
-            with open(filepath, 'w') as f:
-                json.dump(self.hardware_data, f, indent=2)
+            self.write_file(filepath, _json_dumps(self.hardware_data, indent=True))
             print(self.color_text('[+] Data exported to: ' + filepath, Colors.OKGREEN))
             return True
         except Exception as e:
             print(self.color_text('[-] Error exporting: ' + str(e), Colors.FAIL))
             return False
 
+    def _iter_csv_rows(self):
+        """Yield the CSV report row by row: a section title, its rows, then a blank row"""
+        for section, items in self.hardware_data.items():
+            yield [section]
+            if isinstance(items, dict):
+                yield from items.items()
+            elif isinstance(items, list):
+                yield from items
+            yield []
+
     def export_to_csv(self, filepath):
         """Export hardware data to CSV file"""
         try:
@@ -469,24 +850,32 @@ class HardwareFetcher:
                 print(self.color_text(f'[DRY-RUN] Would export CSV to: {filepath}', Colors.OKBLUE))
                 return True
             
-            os.makedirs(os.path.dirname(filepath) if os.path.dirname(filepath) else '.', exist_ok=True)
-            with open(filepath, 'w', newline='') as f:
-                writer = csv.writer(f)
-                for section, items in self.hardware_data.items():
-                    writer.writerow([section])
-                    if isinstance(items, dict):
-                        for key, value in items.items():
-                            writer.writerow([key, value])
-                    elif isinstance(items, list):
-                        for row in items:
-                            writer.writerow(row)
-                    writer.writerow([])
+            import csv               # Only CSV exports pay for loading the csv module
+            
+            # One writerows call over the whole report into memory, then one file write
+            buffer = io.StringIO()
+            csv.writer(buffer).writerows(self._iter_csv_rows())
+            self.write_file(filepath, buffer.getvalue().encode('utf-8'))
             print(self.color_text('[+] Data exported to: ' + filepath, Colors.OKGREEN))
             return True
         except Exception as e:
             print(self.color_text('[-] Error exporting: ' + str(e), Colors.FAIL))
             return False
 
+    def _iter_txt_lines(self):
+        """Yield the TXT report line by line"""
+        yield f"HARDWARE REPORT - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+        yield f'{SEP80}\n\n'
+        for section, items in self.hardware_data.items():
+            yield f'\n{SEP80}\n{section}\n{SEP80}\n\n'
+            if isinstance(items, dict):
+                for key, value in items.items():
+                    yield f'{key}: {value}\n'
+            elif isinstance(items, list):
+                for row in items:
+                    yield ' | '.join(map(str, row)) + '\n'
+            yield '\n'
+
     def export_to_txt(self, filepath):
         """Export hardware data to TXT file"""
         try:
@@ -494,81 +883,163 @@ class HardwareFetcher:
                 print(self.color_text(f'[DRY-RUN] Would export TXT to: {filepath}', Colors.OKBLUE))
                 return True
             
-            os.makedirs(os.path.dirname(filepath) if os.path.dirname(filepath) else '.', exist_ok=True)
-            with open(filepath, 'w') as f:
-                f.write('HARDWARE REPORT - ' + datetime.now().strftime('%Y-%m-%d %H:%M:%S') + '\n')
-                f.write('=' * 80 + '\n\n')
-                for section, items in self.hardware_data.items():
-                    f.write('\n' + '=' * 80 + '\n')
-                    f.write(section + '\n')
-                    f.write('=' * 80 + '\n\n')
-                    if isinstance(items, dict):
-                        for key, value in items.items():
-                            f.write('{}: {}\n'.format(key, value))
-                    elif isinstance(items, list):
-                        for row in items:
-                            f.write(' | '.join(str(x) for x in row) + '\n')
-                    f.write('\n')
+            # Stream lines through a large buffer instead of building the whole report in memory
+            try:
+                f = open(filepath, 'w', encoding='utf-8', buffering=1 << 20)
+            except FileNotFoundError:
+                os.makedirs(os.path.dirname(filepath), exist_ok=True)
+                f = open(filepath, 'w', encoding='utf-8', buffering=1 << 20)
+            with f:
+                f.writelines(self._iter_txt_lines())
             print(self.color_text('[+] Data exported to: ' + filepath, Colors.OKGREEN))
             return True
         except Exception as e:
             print(self.color_text('[-] Error exporting: ' + str(e), Colors.FAIL))
             return False
 
-    def collect_all_data(self):
-        """Collect all hardware information from all sources"""
-        self.hardware_data['CPU Components'] = self.get_cpu_components()
-        self.hardware_data['RAM Components'] = self.get_ram_components()
-        self.hardware_data['Motherboard'] = self.get_motherboard_info()
-        self.hardware_data['Storage Devices'] = self.get_storage_components()
-        self.hardware_data['GPU Devices'] = self.get_gpu_info()
+    def collect_all_data(self, refresh=False):
+        """Collect all hardware information from all sources (once per instance unless refresh=True)"""
+        if self._collected and not refresh:
+            return
+        if refresh:
+            # Drop memoized probe output so volatile values (CPU MHz, SMART health) are re-read
+            self._cpu_count = self._cpuinfo_cache = self._meminfo_cache = None
+            self._dmi_cache = {}
+            # An empty (not None) table stops the on-disk dmidecode cache from being reloaded
+            self._dmi_disk_cache = {}
+            self._dmi_sysfs_cache = None
+            self._pci_cache = None
+            _cached_command.cache_clear()
+        
+        collectors = {
+            'CPU Components': self.get_cpu_components,
+            'RAM Components': self.get_ram_components,
+            'Motherboard': self.get_motherboard_info,
+            'Storage Devices': self.get_storage_components,
+            'GPU Devices': self.get_gpu_info,
+        }
         if self.verbosity >= 2:
-            self.hardware_data['PCI Devices'] = self.get_pci_devices()
+            # Extended reports list the main controller classes; deep reports list every device
+            if self.verbosity >= 3:
+                collectors['PCI Devices'] = self.get_pci_devices
+            else:
+                collectors['PCI Devices'] = lambda: self.get_pci_devices(PCI_SUMMARY_CLASSES)
+        
+        # Reuse stable sections collected earlier in this boot, refreshing only volatile ones;
+        # an explicit refresh re-collects everything
+        cached = {} if refresh else self._load_report_cache()
+        pending = {name: collector for name, collector in collectors.items()
+                   if name in self.VOLATILE_SECTIONS or name not in cached}
+        
+        # Collectors are independent and mostly wait on subprocesses and file reads,
+        # so running them in threads overlaps that waiting
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            futures = {name: executor.submit(collector) for name, collector in pending.items()}
+            for name in collectors:
+                self.hardware_data[name] = futures[name].result() if name in futures else cached[name]
+        
+        self._save_report_cache()
+        self._collected = True
+        self._export_timestamp = None
+
+    def _cache_file(self, kind):
+        """Return the 'report' or 'dmi' cache path for the current boot and user, or None without a boot ID"""
+        # Hardware only changes across reboots, and a sudo run must not reuse another user's cache
+        boot_id = self.read_file('/proc/sys/kernel/random/boot_id')
+        if not boot_id:
+            return None
+        return os.path.join(CACHE_DIR, f'{kind}-{os.geteuid()}-{boot_id}.json')
+
+    def _prune_old_caches(self):
+        """Remove this user's report and dmidecode caches from earlier boots"""
+        keep = (self._cache_file('report'), self._cache_file('dmi'))
+        prefixes = (f'report-{os.geteuid()}-', f'dmi-{os.geteuid()}-')
+        for entry in self.scan_dir(CACHE_DIR):
+            if entry.path not in keep and entry.name.startswith(prefixes) and entry.name.endswith('.json'):
+                try:
+                    os.unlink(entry.path)
+                except OSError:
+                    pass
+
+    def _load_report_cache(self):
+        """Load hardware data cached earlier in this boot at the same verbosity"""
+        cache_file = self._cache_file('report')
+        if not self.use_cache or not cache_file:
+            return {}
+        try:
+            cached = _json_loads(self.read_file(cache_file, raw=True) or b'{}')
+        except ValueError:
+            return {}
+        if not isinstance(cached, dict) or cached.get('verbosity') != self.verbosity:
+            return {}
+        return cached.get('hardware_data', {})
+
+    def _save_report_cache(self):
+        """Persist collected hardware data so later runs in this boot can skip collection"""
+        cache_file = self._cache_file('report')
+        if not cache_file:
+            return
+        try:
+            payload = _json_dumps({'verbosity': self.verbosity, 'hardware_data': self.hardware_data})
+            self._write_cache_file(cache_file, payload)
+        except OSError:
+            return
+        self._prune_old_caches()
 
     def display_all_data(self):
         """Display all collected hardware information in formatted tables"""
-        print(self.color_text('\n' + '=' * 80, Colors.HEADER))
-        print(self.color_text('VM HARDWARE COMPONENTS FETCHER'.center(80), Colors.HEADER))
-        print(self.color_text('=' * 80 + '\n', Colors.HEADER))
+        hardware_data = self.hardware_data
+        empty_dict = {}
+        empty_list = []
+        header = self.format_header
+        table = self.format_table
+        
+        # Build the whole report and emit it with a single write
+        out = [
+            self.color_text(f'\n{SEP80}', Colors.HEADER), '\n',
+            self.color_text('VM HARDWARE COMPONENTS FETCHER'.center(80), Colors.HEADER), '\n',
+            self.color_text(f'{SEP80}\n', Colors.HEADER), '\n',
+        ]
         
         # CPU
-        self.print_header('CPU HARDWARE COMPONENTS')
-        self.print_table([[k, v] for k, v in self.hardware_data.get('CPU Components', {}).items()])
+        out.append(header('CPU HARDWARE COMPONENTS'))
+        out.append(table(hardware_data.get('CPU Components', empty_dict).items()))
         
         # RAM
-        self.print_header('RAM HARDWARE COMPONENTS')
-        self.print_table([[k, v] for k, v in self.hardware_data.get('RAM Components', {}).items()])
+        out.append(header('RAM HARDWARE COMPONENTS'))
+        out.append(table(hardware_data.get('RAM Components', empty_dict).items()))
         
         # Motherboard
-        self.print_header('MOTHERBOARD HARDWARE')
-        self.print_table([[k, v] for k, v in self.hardware_data.get('Motherboard', {}).items()])
+        out.append(header('MOTHERBOARD HARDWARE'))
+        out.append(table(hardware_data.get('Motherboard', empty_dict).items()))
         
         # Storage
-        self.print_header('STORAGE HARDWARE COMPONENTS')
-        storage_data = self.hardware_data.get('Storage Devices', [])
+        out.append(header('STORAGE HARDWARE COMPONENTS'))
+        storage_data = hardware_data.get('Storage Devices', empty_list)
         if storage_data:
-            self.print_table(storage_data)
+            out.append(table(storage_data))
         else:
-            print(self.color_text('No storage devices found\n', Colors.WARNING))
+            out.append(self.color_text('No storage devices found\n', Colors.WARNING) + '\n')
         
         # GPU
-        self.print_header('GPU HARDWARE COMPONENTS')
-        gpu_data = self.hardware_data.get('GPU Devices', [])
+        out.append(header('GPU HARDWARE COMPONENTS'))
+        gpu_data = hardware_data.get('GPU Devices', empty_list)
         if gpu_data:
-            self.print_table(gpu_data)
+            out.append(table(gpu_data))
         else:
-            print(self.color_text('No GPU devices detected\n', Colors.WARNING))
+            out.append(self.color_text('No GPU devices detected\n', Colors.WARNING) + '\n')
         
         # PCI
         if self.verbosity >= 2:
-            self.print_header('PCI HARDWARE DEVICES')
-            pci_data = self.hardware_data.get('PCI Devices', [])
+            out.append(header('PCI HARDWARE DEVICES'))
+            pci_data = hardware_data.get('PCI Devices', empty_list)
             if pci_data:
-                self.print_table(pci_data)
+                out.append(table(pci_data))
             else:
-                print(self.color_text('No PCI devices found\n', Colors.WARNING))
+                out.append(self.color_text('No PCI devices found\n', Colors.WARNING) + '\n')
         
-        print(self.color_text('=' * 80 + '\n', Colors.HEADER))
+        out.append(self.color_text(f'{SEP80}\n', Colors.HEADER) + '\n')
+        sys.stdout.write(''.join(out))
 
     def export(self, export_format):
         """Export collected hardware data in specified format"""
@@ -576,19 +1047,16 @@ class HardwareFetcher:
             print(self.color_text('No data to export. Call collect_all_data() first.', Colors.WARNING))
             return False
         
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        
-        if export_format == 'json':
-            filepath = os.path.join(self.export_dir, f'hardware_info_{timestamp}.json')
-            return self.export_to_json(filepath)
-        elif export_format == 'csv':
-            filepath = os.path.join(self.export_dir, f'hardware_info_{timestamp}.csv')
-            return self.export_to_csv(filepath)
-        elif export_format == 'txt':
-            filepath = os.path.join(self.export_dir, f'hardware_info_{timestamp}.txt')
-            return self.export_to_txt(filepath)
+        entry = self._EXPORTERS.get(export_format)
+        if not entry:
+            return False
+        extension, method = entry
         
-        return False
+        # One timestamp per collection, so json/csv/txt exports of the same data share a file name
+        if self._export_timestamp is None:
+            self._export_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        filepath = os.path.join(self.export_dir, f'hardware_info_{self._export_timestamp}.{extension}')
+        return getattr(self, method)(filepath)
 
     def run(self, export_format=None):
         """Execute full hardware detection workflow"""
@@ -597,7 +1065,10 @@ class HardwareFetcher:
             is_compatible = self.print_compatibility_check()
             return is_compatible
         
-        # Full execution - collect data first
+        # Full execution - refuse to probe without /proc/cpuinfo, then collect data
+        if not self._compat['procfs']:
+            print(self.color_text('ERROR: /proc/cpuinfo not found. System not compatible!\n', Colors.FAIL))
+            return False
         self.collect_all_data()
         
         # Only display if no export, otherwise just export
@@ -614,9 +1085,9 @@ def main():
         description='Hardware Fetcher - Advanced VM Hardware Analysis',
         formatter_class=argparse.RawDescriptionHelpFormatter,
         epilog='''VERBOSITY LEVELS:
-  --v         (Level 1): Basic hardware overview
-  --vv        (Level 2): Extended information
-  --vvv       (Level 3): Deep analysis with all details
+  -v          (Level 1): Basic hardware overview
+  -vv         (Level 2): Extended information
+  -vvv        (Level 3): Deep analysis with all details
 
 EXPORT OPTIONS:
   --export-format=json             Export to JSON
@@ -624,38 +1095,39 @@ EXPORT OPTIONS:
   --export-format=txt              Export to TXT
   --export-directory=/path         Save exports to specific directory
 
+CACHE OPTIONS:
+  --no-cache                       Ignore cached results and re-read all hardware
+
 DRY-RUN MODES:
   --dry-run=true                   Test mode (compatibility check only)
   --dry-run=false                  Normal mode (full execution) [REQUIRED]
 
 EXAMPLES:
-  python3 hardware_fetcher.py --vvv --dry-run=true
-  python3 hardware_fetcher.py --vvv --dry-run=false
-  python3 hardware_fetcher.py --vvv --dry-run=false --export-format=json --export-directory=/tmp
-  python3 hardware_fetcher.py --vv --dry-run=false --export-format=csv
+  python3 hardware_fetcher.py -vvv --dry-run=true
+  python3 hardware_fetcher.py -vvv --dry-run=false
+  python3 hardware_fetcher.py -vvv --dry-run=false --export-format=json --export-directory=/tmp
+  python3 hardware_fetcher.py -vv --dry-run=false --export-format=csv
         '''
     )
     
-    parser.add_argument('--v', action='store_true', help='Verbosity level 1')
-    parser.add_argument('--vv', action='store_true', help='Verbosity level 2')
-    parser.add_argument('--vvv', action='store_true', help='Verbosity level 3')
+    parser.add_argument('-v', '--v', '--verbose', dest='verbose', action='count', default=0,
+                       help='Verbosity level, repeat for more detail (-v, -vv, -vvv)')
+    # Legacy spellings of levels 2 and 3
+    parser.add_argument('--vv', dest='verbose', action='store_const', const=2, help=argparse.SUPPRESS)
+    parser.add_argument('--vvv', dest='verbose', action='store_const', const=3, help=argparse.SUPPRESS)
     parser.add_argument('--export-format', choices=['json', 'csv', 'txt'], default=None,
                        help='Export format: json, csv, or txt')
     parser.add_argument('--export-directory', default='.',
                        help='Directory to save exports (default: current)')
     parser.add_argument('--dry-run', choices=['true', 'false'], required=True,
                        help='Dry-run mode: true=test only, false=full run (REQUIRED)')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Ignore cached results and re-read all hardware')
     
     args = parser.parse_args()
     
-    # Determine verbosity level
-    verbosity = 1
-    if args.vvv:
-        verbosity = 3
-    elif args.vv:
-        verbosity = 2
-    elif args.v:
-        verbosity = 1
+    # Clamp verbosity level to 1..3
+    verbosity = max(1, min(args.verbose, 3))
     
     # Parse dry-run flag
     dry_run_enabled = args.dry_run == 'true'
@@ -664,7 +1136,8 @@ EXAMPLES:
     fetcher = HardwareFetcher(
         verbosity=verbosity,
         dry_run=dry_run_enabled,
-        export_directory=args.export_directory
+        export_directory=args.export_directory,
+        use_cache=not args.no_cache
     )
     
     success = fetcher.run(export_format=args.export_format)